@@ -1,18 +1,16 @@
 import pandas as pd
-import yfinance as yf
 from langchain.chains import LLMChain, SequentialChain
-from langchain.prompts import PromptTemplate
+from langchain.prompts import ChatPromptTemplate, HumanMessagePromptTemplate
 from langchain_community.tools import Tool
 from langchain.agents import AgentExecutor, create_react_agent
 from langchain_core.messages import SystemMessage
-from langchain_groq import ChatGroq
-from dotenv import load_dotenv
-import os
+import asyncio
+import argparse
+from functools import lru_cache
 
-load_dotenv()
-# Initialize LLM
-GROQ_API_KEY = os.environ.get("GROQ_API_KEY")
-llm = ChatGroq(model_name="llama3-70b-8192", groq_api_key=GROQ_API_KEY)
+import cache
+import market_data
+from llm_client import factual_llm, llm, session_runner
 
 # ------------------------
 # Stock Analysis Tools
@@ -22,39 +20,24 @@ llm = ChatGroq(model_name="llama3-70b-8192", groq_api_key=GROQ_API_KEY)
 def get_basic_stock_info(ticker: str) -> str:
     """Retrieves basic information about a single stock."""
     try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
-
-        basic_info = {
-            "Name": info.get("longName", "N/A"),
-            "Sector": info.get("sector", "N/A"),
-            "Industry": info.get("industry", "N/A"),
-            "Market Cap": (
-                f"${info.get('marketCap', 'N/A'):,}" if info.get("marketCap") else "N/A"
-            ),
-            "Current Price": (
-                f"${info.get('currentPrice', 'N/A'):.2f}"
-                if info.get("currentPrice")
-                else "N/A"
-            ),
-            "52 Week High": (
-                f"${info.get('fiftyTwoWeekHigh', 'N/A'):.2f}"
-                if info.get("fiftyTwoWeekHigh")
-                else "N/A"
-            ),
-            "52 Week Low": (
-                f"${info.get('fiftyTwoWeekLow', 'N/A'):.2f}"
-                if info.get("fiftyTwoWeekLow")
-                else "N/A"
-            ),
-            "Average Volume": (
-                f"{info.get('averageVolume', 'N/A'):,}"
-                if info.get("averageVolume")
-                else "N/A"
-            ),
-        }
-
-        return "\n".join([f"{k}: {v}" for k, v in basic_info.items()])
+        info = market_data.fetch_info(ticker)
+
+        market_cap = info.get("marketCap")
+        price = info.get("currentPrice")
+        high_52w = info.get("fiftyTwoWeekHigh")
+        low_52w = info.get("fiftyTwoWeekLow")
+        avg_volume = info.get("averageVolume")
+
+        return (
+            f"Name: {info.get('longName', 'N/A')}\n"
+            f"Sector: {info.get('sector', 'N/A')}\n"
+            f"Industry: {info.get('industry', 'N/A')}\n"
+            f"Market Cap: {f'${market_cap:,}' if market_cap else 'N/A'}\n"
+            f"Current Price: {f'${price:.2f}' if price else 'N/A'}\n"
+            f"52 Week High: {f'${high_52w:.2f}' if high_52w else 'N/A'}\n"
+            f"52 Week Low: {f'${low_52w:.2f}' if low_52w else 'N/A'}\n"
+            f"Average Volume: {f'{avg_volume:,}' if avg_volume else 'N/A'}"
+        )
 
     except Exception as e:
         return f"Error fetching stock info: {str(e)}"
@@ -65,59 +48,81 @@ def get_basic_stock_info(ticker: str) -> str:
 # ------------------------
 
 
+@lru_cache(maxsize=1)
 def create_analysis_chains():
-    research_prompt = PromptTemplate(
-        input_variables=["ticker", "stock_data"],
-        template="""
-        Analyze the following stock ticker: {ticker}
-        
-        Stock Data:
-        {stock_data}
-        
-        Provide a comprehensive overview including:
+    """Creates the research/analysis/recommendation chains (built once per process)"""
+    # Static instructions come first and the per-ticker data last, so the
+    # invariant prefix can be served from the provider's prompt cache
+    research_prompt = ChatPromptTemplate.from_messages(
+        [
+            SystemMessage(content="You are an equity research analyst."),
+            HumanMessagePromptTemplate.from_template(
+                """
+        Provide a comprehensive overview of the stock below including:
         1. Company description
         2. Key financial metrics
         3. Recent performance
         4. Industry position
-        """,
+
+        ---
+        Ticker: {ticker}
+
+        Stock Data:
+        {stock_data}
+        """
+            ),
+        ]
     )
 
-    analysis_prompt = PromptTemplate(
-        input_variables=["ticker", "research_report"],
-        template="""
-        Based on this research report for {ticker}:
-        {research_report}
-        
-        Perform detailed analysis covering:
+    analysis_prompt = ChatPromptTemplate.from_messages(
+        [
+            SystemMessage(content="You are an equity research analyst."),
+            HumanMessagePromptTemplate.from_template(
+                """
+        Based on the research report below, perform detailed analysis covering:
         1. Valuation assessment
         2. Growth prospects
         3. Risk factors
         4. Competitive advantages
-        """,
-    )
 
-    recommendation_prompt = PromptTemplate(
-        input_variables=["ticker", "research_report", "analysis_report"],
-        template="""
-        For stock {ticker}, synthesize this information:
-        
-        RESEARCH SUMMARY:
+        ---
+        Ticker: {ticker}
+
+        Research Report:
         {research_report}
-        
-        ANALYSIS FINDINGS:
-        {analysis_report}
-        
-        Generate an investment recommendation covering:
+        """
+            ),
+        ]
+    )
+
+    recommendation_prompt = ChatPromptTemplate.from_messages(
+        [
+            SystemMessage(content="You are an equity research analyst."),
+            HumanMessagePromptTemplate.from_template(
+                """
+        Synthesize the information below and generate an investment
+        recommendation covering:
         1. Investment thesis
         2. Price targets
         3. Risk/reward assessment
         4. Suggested position size
-        """,
+
+        ---
+        Ticker: {ticker}
+
+        RESEARCH SUMMARY:
+        {research_report}
+
+        ANALYSIS FINDINGS:
+        {analysis_report}
+        """
+            ),
+        ]
     )
 
     return {
         "research": LLMChain(
-            llm=llm, prompt=research_prompt, output_key="research_report"
+            llm=factual_llm, prompt=research_prompt, output_key="research_report"
         ),
         "analysis": LLMChain(
             llm=llm, prompt=analysis_prompt, output_key="analysis_report"
@@ -133,7 +138,12 @@ def create_analysis_chains():
 # ------------------------
 
 
-def analyze_stock(ticker: str):
+def print_token(token: str):
+    """Writes a streamed LLM token to the console without buffering"""
+    print(token, end="", flush=True)
+
+
+async def analyze_stock(ticker: str):
     """Run complete stock analysis workflow"""
     print(f"\n🔍 Analyzing {ticker}...\n")
 
@@ -145,52 +155,68 @@ def analyze_stock(ticker: str):
     # Setup analysis chains
     chains = create_analysis_chains()
 
-    # Run analysis pipeline
-    research_result = chains["research"].run(
-        {"ticker": ticker, "stock_data": stock_data}
-    )
-
+    # Run analysis pipeline, streaming each report as it is generated
     print("\n📝 Research Report:")
-    print(research_result)
-
-    analysis_result = chains["analysis"].run(
-        {"ticker": ticker, "research_report": research_result}
+    research_result = await cache.cached_arun(
+        chains["research"],
+        {"ticker": ticker, "stock_data": stock_data},
+        on_token=print_token,
     )
 
-    print("\n📈 Detailed Analysis:")
-    print(analysis_result)
+    print("\n\n📈 Detailed Analysis:")
+    analysis_result = await cache.cached_arun(
+        chains["analysis"],
+        {"ticker": ticker, "research_report": research_result},
+        on_token=print_token,
+    )
 
-    recommendation = chains["recommendation"].run(
+    print("\n\n💡 Investment Recommendation:")
+    await cache.cached_arun(
+        chains["recommendation"],
         {
             "ticker": ticker,
             "research_report": research_result,
             "analysis_report": analysis_result,
-        }
+        },
+        on_token=print_token,
     )
+    print()
 
-    print("\n💡 Investment Recommendation:")
-    print(recommendation)
+    print(
+        f"\n🗄️  LLM cache: {cache.llm_stats['hits']} hits, "
+        f"{cache.llm_stats['misses']} misses"
+    )
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Stock analysis CLI tool")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="always refetch market data and LLM output",
+    )
+    args = parser.parse_args()
+    cache.set_enabled(not args.no_cache)
+
     print("📈 Stock Analysis CLI Tool")
     print("-------------------------")
 
-    while True:
-        ticker = input("\nEnter stock ticker (or 'quit' to exit): ").strip().upper()
+    with session_runner() as runner:
+        while True:
+            ticker = input("\nEnter stock ticker (or 'quit' to exit): ").strip().upper()
 
-        if ticker.lower() in ["quit", "exit"]:
-            print("Goodbye!")
-            break
+            if ticker.lower() in ["quit", "exit"]:
+                print("Goodbye!")
+                break
 
-        if not ticker:
-            print("Please enter a valid ticker symbol")
-            continue
+            if not ticker:
+                print("Please enter a valid ticker symbol")
+                continue
 
-        try:
-            analyze_stock(ticker)
-        except Exception as e:
-            print(f"Error analyzing stock: {str(e)}")
+            try:
+                runner.run(analyze_stock(ticker))
+            except Exception as e:
+                print(f"Error analyzing stock: {str(e)}")
 
 
 if __name__ == "__main__":
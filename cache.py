@@ -0,0 +1,117 @@
+import hashlib
+import os
+import time
+from datetime import date
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import diskcache
+
+# ------------------------
+# Two-level TTL cache (process memory + disk)
+# ------------------------
+
+CACHE_DIR = os.path.expanduser("~/.cache/stock-agent")
+LLM_TTL = 24 * 60 * 60
+
+_enabled = True
+_memory: Dict[str, Tuple[float, Any]] = {}
+_disk: Optional[diskcache.Cache] = None
+
+llm_stats = {"hits": 0, "misses": 0}
+
+
+def set_enabled(enabled: bool):
+    """Turns caching on or off for the whole process (--no-cache)"""
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def _get_disk() -> diskcache.Cache:
+    global _disk
+    if _disk is None:
+        _disk = diskcache.Cache(CACHE_DIR)
+    return _disk
+
+
+def lookup(key: str) -> Optional[Any]:
+    """Returns the cached value for key, or None if missing/expired"""
+    if not _enabled:
+        return None
+
+    entry = _memory.get(key)
+    if entry is not None:
+        expires_at, value = entry
+        if time.time() < expires_at:
+            return value
+        _memory.pop(key, None)
+
+    value, expires_at = _get_disk().get(key, expire_time=True)
+    if value is not None and expires_at is not None:
+        _memory[key] = (expires_at, value)
+    return value
+
+
+def store(key: str, value: Any, ttl: int):
+    """Caches value under key for ttl seconds"""
+    if not _enabled:
+        return
+
+    _memory[key] = (time.time() + ttl, value)
+    _get_disk().set(key, value, expire=ttl)
+
+
+# ------------------------
+# LLM Output Cache
+# ------------------------
+
+
+def _llm_cache_key(chain, prompt: str) -> str:
+    llm = chain.llm
+    parts = [
+        getattr(llm, "model_name", type(llm).__name__),
+        str(getattr(llm, "temperature", "")),
+        prompt,
+        date.today().isoformat(),
+    ]
+    return "llm:" + hashlib.sha256("\x00".join(parts).encode()).hexdigest()
+
+
+async def cached_arun(
+    chain,
+    inputs: Dict,
+    ttl: int = LLM_TTL,
+    on_token: Optional[Callable[[str], None]] = None,
+) -> str:
+    """
+    Runs an LLMChain, reusing today's output for an identical prompt.
+    The key covers model, temperature and the fully rendered prompt, so
+    any change in template or input data is a miss.
+
+    If on_token is given, the completion is streamed and each token is
+    passed to it as it arrives (a cache hit is passed as one chunk).
+    """
+    prompt = chain.prompt.format_prompt(**inputs)
+    key = _llm_cache_key(chain, prompt.to_string())
+    result = lookup(key)
+    if result is not None:
+        llm_stats["hits"] += 1
+        if on_token is not None:
+            on_token(result)
+        return result
+
+    llm_stats["misses"] += 1
+    if on_token is None:
+        result = await chain.arun(inputs)
+    else:
+        tokens = []
+        async for chunk in chain.llm.astream(prompt):
+            tokens.append(chunk.content)
+            on_token(chunk.content)
+        result = "".join(tokens)
+
+    store(key, result, ttl)
+    return result
@@ -0,0 +1,49 @@
+import asyncio
+import os
+from contextlib import contextmanager
+
+import httpx
+from dotenv import load_dotenv
+from langchain_groq import ChatGroq
+
+# Load environment variables
+load_dotenv()
+
+# Initialize LLM with error handling
+GROQ_API_KEY = os.environ.get("GROQ_API_KEY")
+if not GROQ_API_KEY:
+    raise ValueError("GROQ_API_KEY environment variable not found")
+
+# Shared keep-alive connection pool for every async Groq request
+http_async_client = httpx.AsyncClient(
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    timeout=30.0,
+)
+
+llm = ChatGroq(
+    model_name="llama3-70b-8192",
+    groq_api_key=GROQ_API_KEY,
+    temperature=0.3,  # Lower temperature for more factual responses
+    http_async_client=http_async_client,
+)
+
+# Deterministic model for data-driven stages, so repeat runs hit the LLM cache
+factual_llm = ChatGroq(
+    model_name="llama3-70b-8192",
+    groq_api_key=GROQ_API_KEY,
+    temperature=0,
+    http_async_client=http_async_client,
+)
+
+
+@contextmanager
+def session_runner():
+    """
+    Event loop for a whole CLI session. A single loop keeps the pooled
+    connections alive between tickers; the pool is closed on exit.
+    """
+    with asyncio.Runner() as runner:
+        try:
+            yield runner
+        finally:
+            runner.run(http_async_client.aclose())
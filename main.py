@@ -1,32 +1,25 @@
 import pandas as pd
-import yfinance as yf
 from langchain.chains import LLMChain, SequentialChain
-from langchain.prompts import PromptTemplate
+from langchain.prompts import ChatPromptTemplate, HumanMessagePromptTemplate
 from langchain_community.tools import Tool
 from langchain.agents import AgentExecutor, create_react_agent
 from langchain_core.messages import SystemMessage
-from langchain_groq import ChatGroq
-from dotenv import load_dotenv
-import os
+import json
+import math
 import time
+import asyncio
+import argparse
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timedelta
 import numpy as np
+from numba import njit
 import matplotlib.pyplot as plt
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Literal, Tuple, Optional
 
-# Load environment variables
-load_dotenv()
-
-# Initialize LLM with error handling
-GROQ_API_KEY = os.environ.get("GROQ_API_KEY")
-if not GROQ_API_KEY:
-    raise ValueError("GROQ_API_KEY environment variable not found")
-
-llm = ChatGroq(
-    model_name="llama3-70b-8192",
-    groq_api_key=GROQ_API_KEY,
-    temperature=0.3,  # Lower temperature for more factual responses
-)
+import cache
+import market_data
+from llm_client import factual_llm, llm, session_runner
 
 # ------------------------
 # Professional Analysis Tools
@@ -35,47 +28,106 @@ llm = ChatGroq(
 
 def get_comprehensive_stock_data(ticker: str) -> Tuple[Dict, pd.DataFrame]:
     """
-    Retrieves comprehensive stock data including:
+    Retrieves the stock data consumed by the analysis:
     - Company fundamentals
-    - Historical prices
-    - Analyst estimates
+    - Historical prices (1 year)
     Returns tuple of (info_dict, historical_data_df)
+
+    The Yahoo endpoints are independent, so they are fetched concurrently.
+    Results are cached per ticker and day (see market_data).
     """
     try:
-        stock = yf.Ticker(ticker)
-
-        # Get all available info
-        info = stock.info
-
-        # Get historical data for different timeframes
-        hist_1y = stock.history(period="1y")
-        hist_5y = stock.history(period="5y")
-
-        # Get analyst recommendations
-        recommendations = stock.recommendations
-
-        # Get institutional holders
-        institutional = stock.institutional_holders
-
-        # Get financial statements
-        balance_sheet = stock.balance_sheet
-        income_stmt = stock.income_stmt
-        cash_flow = stock.cashflow
+        info_future = market_data.executor.submit(market_data.fetch_info, ticker)
+        hist_future = market_data.executor.submit(
+            market_data.fetch_history, ticker, "1y"
+        )
 
-        return {
-            "info": info,
-            "recommendations": recommendations,
-            "institutional_holders": institutional,
-            "balance_sheet": balance_sheet,
-            "income_statement": income_stmt,
-            "cash_flow": cash_flow,
-        }, hist_1y
+        return {"info": info_future.result()}, hist_future.result()
 
     except Exception as e:
         raise Exception(f"Failed to fetch data for {ticker}: {str(e)}")
 
 
-def calculate_technical_indicators(data: pd.DataFrame) -> Dict:
+@njit(cache=True, error_model="numpy")
+def technical_tail(
+    closes: np.ndarray, volumes: np.ndarray
+) -> Tuple[float, float, float, float, float, float, float]:
+    """
+    Computes the final value of every indicator in one pass over the prices,
+    with scalar accumulators only. Windows that are not yet full give NaN,
+    matching pandas rolling(); EMAs match ewm(span, adjust=False).
+    `closes` must be NaN-free; NaN volumes are skipped like pandas mean().
+    Returns (sma_50, sma_200, rsi_14, macd, signal, std_20, volume_avg)
+    """
+    n = closes.shape[0]
+    alpha_12 = 2.0 / 13.0
+    alpha_26 = 2.0 / 27.0
+    alpha_9 = 2.0 / 10.0
+
+    ema_12 = closes[0]
+    ema_26 = closes[0]
+    signal = 0.0
+    sum_50 = 0.0
+    sum_200 = 0.0
+    sum_20 = 0.0
+    gain_14 = 0.0
+    loss_14 = 0.0
+    volume_sum = 0.0
+    volume_count = 0
+
+    for i in range(n):
+        price = closes[i]
+        ema_12 = alpha_12 * price + (1.0 - alpha_12) * ema_12
+        ema_26 = alpha_26 * price + (1.0 - alpha_26) * ema_26
+        signal = alpha_9 * (ema_12 - ema_26) + (1.0 - alpha_9) * signal
+        if not np.isnan(volumes[i]):
+            volume_sum += volumes[i]
+            volume_count += 1
+
+        if i >= n - 200:
+            sum_200 += price
+        if i >= n - 50:
+            sum_50 += price
+        if i >= n - 20:
+            sum_20 += price
+        if i >= n - 14 and i > 0:
+            change = price - closes[i - 1]
+            if change > 0:
+                gain_14 += change
+            else:
+                loss_14 -= change
+
+    sma_50 = sum_50 / 50 if n >= 50 else np.nan
+    sma_200 = sum_200 / 200 if n >= 200 else np.nan
+    rsi = 100.0 - 100.0 / (1.0 + gain_14 / loss_14) if n >= 15 else np.nan
+
+    std_20 = np.nan
+    if n >= 20:
+        mean_20 = sum_20 / 20
+        squares = 0.0
+        for i in range(n - 20, n):
+            squares += (closes[i] - mean_20) ** 2
+        std_20 = np.sqrt(squares / 19)
+
+    volume_avg = volume_sum / volume_count
+    return sma_50, sma_200, rsi, ema_12 - ema_26, signal, std_20, volume_avg
+
+
+@dataclass(frozen=True, slots=True)
+class TechnicalIndicators:
+    """Latest indicator values; the repr is what the technical prompt sees"""
+
+    sma_50: float
+    sma_200: float
+    rsi: float
+    macd: float
+    signal: float
+    upper_band: float
+    lower_band: float
+    volume_avg: float
+
+
+def calculate_technical_indicators(data: pd.DataFrame) -> TechnicalIndicators:
     """
     Calculates professional technical indicators:
     - Moving averages
@@ -84,41 +136,119 @@ def calculate_technical_indicators(data: pd.DataFrame) -> Dict:
     - Bollinger Bands
     - Volume analysis
     """
-    closes = data["Close"]
-    volumes = data["Volume"]
-
-    # Moving Averages
-    sma_50 = closes.rolling(window=50).mean()
-    sma_200 = closes.rolling(window=200).mean()
-
-    # RSI
-    delta = closes.diff()
-    gain = delta.where(delta > 0, 0).rolling(window=14).mean()
-    loss = -delta.where(delta < 0, 0).rolling(window=14).mean()
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
-
-    # MACD
-    ema_12 = closes.ewm(span=12, adjust=False).mean()
-    ema_26 = closes.ewm(span=26, adjust=False).mean()
-    macd = ema_12 - ema_26
-    signal = macd.ewm(span=9, adjust=False).mean()
+    # A NaN close would poison every later EMA value in the kernel
+    data = data.dropna(subset=["Close"])
+    closes = data["Close"].to_numpy(dtype=np.float64)
+    volumes = data["Volume"].to_numpy(dtype=np.float64)
+
+    # The kernel indexes closes[0] unchecked; unknown/delisted tickers are empty
+    if len(closes) == 0:
+        raise ValueError("no price history")
+
+    sma_50, sma_200, rsi, macd, signal, rolling_std, volume_avg = technical_tail(
+        closes, volumes
+    )
 
     # Bollinger Bands
-    rolling_std = closes.rolling(window=20).std()
     upper_band = sma_50 + (rolling_std * 2)
     lower_band = sma_50 - (rolling_std * 2)
 
-    return {
-        "sma_50": sma_50.iloc[-1],
-        "sma_200": sma_200.iloc[-1],
-        "rsi": rsi.iloc[-1],
-        "macd": macd.iloc[-1],
-        "signal": signal.iloc[-1],
-        "upper_band": upper_band.iloc[-1],
-        "lower_band": lower_band.iloc[-1],
-        "volume_avg": volumes.mean(),
-    }
+    return TechnicalIndicators(
+        sma_50=sma_50,
+        sma_200=sma_200,
+        rsi=rsi,
+        macd=macd,
+        signal=signal,
+        upper_band=upper_band,
+        lower_band=lower_band,
+        volume_avg=volume_avg,
+    )
+
+
+def _period_return(closes: np.ndarray, sessions: int) -> str:
+    """Formatted return over the last `sessions` trading days"""
+    if len(closes) <= sessions:
+        return "N/A"
+    return f"{closes[-1] / closes[-sessions - 1] - 1:+.2%}"
+
+
+def summarize_price_data(data: pd.DataFrame) -> str:
+    """
+    Summarizes price history for the technical prompt:
+    - Returns over 1 month, 3 months and the full year
+    - 52 week range and where the last close sits in it
+    - Recent average volume
+    """
+    closes = data["Close"].to_numpy(dtype=float)
+    volumes = data["Volume"].to_numpy(dtype=float)
+    last_close = closes[-1]
+    high_52w = float(data["High"].to_numpy(dtype=float).max())
+    low_52w = float(data["Low"].to_numpy(dtype=float).min())
+    range_position = (
+        f"{(last_close - low_52w) / (high_52w - low_52w):.0%}"
+        if high_52w > low_52w
+        else "N/A"
+    )
+
+    return (
+        f"Last Close: ${last_close:.2f}\n"
+        f"1 Month Return: {_period_return(closes, 21)}\n"
+        f"3 Month Return: {_period_return(closes, 63)}\n"
+        f"1 Year Return: {closes[-1] / closes[0] - 1:+.2%}\n"
+        f"52 Week High: ${high_52w:.2f}\n"
+        f"52 Week Low: ${low_52w:.2f}\n"
+        f"Position in 52 Week Range: {range_position}\n"
+        f"Average Volume (30 sessions): {volumes[-30:].mean():,.0f}\n"
+        f"Sessions: {len(closes)}"
+    )
+
+
+# Yahoo `info` fields relevant to fundamental analysis; the rest (IDs,
+# officer lists, epoch timestamps, ...) only cost prompt tokens. A tuple
+# keeps the field order, and so the prompt text, stable between runs.
+_INFO_WHITELIST = (
+    "longName",
+    "longBusinessSummary",
+    "sector",
+    "industry",
+    "country",
+    "fullTimeEmployees",
+    "marketCap",
+    "enterpriseValue",
+    "currentPrice",
+    "fiftyTwoWeekHigh",
+    "fiftyTwoWeekLow",
+    "beta",
+    "trailingPE",
+    "forwardPE",
+    "trailingEps",
+    "forwardEps",
+    "dividendYield",
+    "payoutRatio",
+    "totalRevenue",
+    "revenueGrowth",
+    "earningsGrowth",
+    "grossMargins",
+    "operatingMargins",
+    "profitMargins",
+    "returnOnEquity",
+    "returnOnAssets",
+    "totalCash",
+    "totalDebt",
+    "debtToEquity",
+    "currentRatio",
+    "freeCashflow",
+    "operatingCashflow",
+    "recommendationKey",
+    "targetMeanPrice",
+    "numberOfAnalystOpinions",
+)
+
+
+def summarize_company_info(info: Dict) -> str:
+    """Returns the analysis-relevant `info` fields as JSON for the LLM prompt"""
+    relevant = {key: info[key] for key in _INFO_WHITELIST if key in info}
+    return json.dumps(relevant, indent=2, default=str)
 
 
 def generate_valuation_metrics(info: Dict) -> Dict:
@@ -163,83 +293,187 @@ def generate_valuation_metrics(info: Dict) -> Dict:
     }
 
 
+# Thresholds for calls clear enough to skip the recommendation LLM
+OVERBOUGHT_RSI = 70
+OVERSOLD_RSI = 30
+EXPENSIVE_FORWARD_PE = 50
+CHEAP_FORWARD_PE = 15
+STRONG_REVENUE_GROWTH = 0.10
+
+
+def _finite(value) -> Optional[float]:
+    """Returns value if it is a finite number, else None (Yahoo sends "Infinity")"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if math.isfinite(value):
+            return value
+    return None
+
+
+def rule_based_signal(
+    valuation_metrics: Dict, technical_indicators: TechnicalIndicators
+) -> Optional[Literal["strong_buy", "strong_sell"]]:
+    """
+    Returns a signal only when momentum, valuation and growth all agree:
+    - strong_sell: overbought, forward P/E above 50, shrinking revenue
+    - strong_buy: oversold, forward P/E below 15, revenue and earnings growing
+    Anything else (including missing data) returns None and goes to the LLM.
+    """
+    rsi = _finite(technical_indicators.rsi)
+    forward_pe = _finite(valuation_metrics["valuation"]["forward_pe"])
+    revenue_growth = _finite(valuation_metrics["growth"]["revenue_growth"])
+    earnings_growth = _finite(valuation_metrics["growth"]["earnings_growth"])
+
+    if rsi is None or forward_pe is None or revenue_growth is None:
+        return None
+
+    if (
+        rsi > OVERBOUGHT_RSI
+        and forward_pe > EXPENSIVE_FORWARD_PE
+        and revenue_growth < 0
+    ):
+        return "strong_sell"
+
+    if (
+        rsi < OVERSOLD_RSI
+        and 0 < forward_pe < CHEAP_FORWARD_PE
+        and revenue_growth > STRONG_REVENUE_GROWTH
+        and earnings_growth is not None
+        and earnings_growth > 0
+    ):
+        return "strong_buy"
+
+    return None
+
+
+def rule_based_recommendation(
+    ticker: str,
+    signal: str,
+    valuation_metrics: Dict,
+    technical_indicators: TechnicalIndicators,
+) -> str:
+    """Formats the recommendation for a rule-based signal"""
+    action = "STRONG BUY" if signal == "strong_buy" else "STRONG SELL"
+    forward_pe = valuation_metrics["valuation"]["forward_pe"]
+    revenue_growth = valuation_metrics["growth"]["revenue_growth"]
+    earnings_growth = _finite(valuation_metrics["growth"]["earnings_growth"])
+    return (
+        f"Rating: {action} ({ticker}, rule-based)\n"
+        f"RSI (14): {technical_indicators.rsi:.1f}\n"
+        f"Forward P/E: {forward_pe:.1f}\n"
+        f"Revenue Growth: {revenue_growth:+.1%}\n"
+        f"Earnings Growth: "
+        f"{f'{earnings_growth:+.1%}' if earnings_growth is not None else 'N/A'}\n"
+        f"Momentum, valuation and growth all point the same way; "
+        f"see the fundamental and technical reports above for detail."
+    )
+
+
 # ------------------------
 # Professional Analysis Chains
 # ------------------------
 
 
+@lru_cache(maxsize=1)
 def create_professional_chains():
-    """Creates institutional-grade analysis chains"""
-
-    fundamental_prompt = PromptTemplate(
-        input_variables=["ticker", "info", "valuation_metrics"],
-        template="""
-        Perform comprehensive fundamental analysis for {ticker}:
-        
-        Company Information:
-        {info}
-        
-        Valuation Metrics:
-        {valuation_metrics}
-        
+    """Creates institutional-grade analysis chains (built once per process)"""
+
+    # Static instructions come first and the per-ticker data last, so the
+    # invariant prefix can be served from the provider's prompt cache
+    fundamental_prompt = ChatPromptTemplate.from_messages(
+        [
+            SystemMessage(
+                content="You are an institutional equity research analyst "
+                "performing comprehensive fundamental analysis."
+            ),
+            HumanMessagePromptTemplate.from_template(
+                """
         Your analysis must include:
         1. Business Model Analysis (competitive advantages, moat)
         2. Financial Health Assessment (liquidity, solvency)
         3. Growth Prospects (historical and projected)
         4. Valuation Assessment (relative and absolute)
         5. Industry Position and Competitive Landscape
-        
+
         Format as a professional research report with clear sections.
-        """,
+
+        ---
+        Ticker: {ticker}
+
+        Company Information:
+        {info}
+
+        Valuation Metrics:
+        {valuation_metrics}
+        """
+            ),
+        ]
     )
 
-    technical_prompt = PromptTemplate(
-        input_variables=["ticker", "technical_indicators", "price_data"],
-        template="""
-        Perform technical analysis for {ticker}:
-        
-        Technical Indicators:
-        {technical_indicators}
-        
-        Price Data Summary:
-        {price_data}
-        
+    technical_prompt = ChatPromptTemplate.from_messages(
+        [
+            SystemMessage(
+                content="You are an institutional technical analyst "
+                "performing technical analysis of a stock."
+            ),
+            HumanMessagePromptTemplate.from_template(
+                """
         Analyze:
         1. Trend Analysis (short, medium, long-term)
         2. Key Support/Resistance Levels
         3. Momentum Indicators Interpretation
         4. Volume Analysis
         5. Chart Patterns
-        
+
         Provide specific price levels for entry/exit points.
-        """,
+
+        ---
+        Ticker: {ticker}
+
+        Technical Indicators:
+        {technical_indicators}
+
+        Price Data Summary:
+        {price_data}
+        """
+            ),
+        ]
     )
 
-    recommendation_prompt = PromptTemplate(
-        input_variables=["ticker", "fundamental_analysis", "technical_analysis"],
-        template="""
-        Generate institutional investment recommendation for {ticker}:
-        
-        Fundamental Analysis:
-        {fundamental_analysis}
-        
-        Technical Analysis:
-        {technical_analysis}
-        
+    recommendation_prompt = ChatPromptTemplate.from_messages(
+        [
+            SystemMessage(
+                content="You are a portfolio strategist generating "
+                "institutional investment recommendations."
+            ),
+            HumanMessagePromptTemplate.from_template(
+                """
         Include:
         1. Investment Thesis (3-5 key points)
         2. Price Targets (conservative/base/aggressive)
         3. Risk Assessment (systematic/unsystematic risks)
         4. Position Sizing Guidance
         5. Monitoring Criteria
-        
+
         Format for a professional investment committee.
-        """,
+
+        ---
+        Ticker: {ticker}
+
+        Fundamental Analysis:
+        {fundamental_analysis}
+
+        Technical Analysis:
+        {technical_analysis}
+        """
+            ),
+        ]
     )
 
     return {
         "fundamental": LLMChain(
-            llm=llm, prompt=fundamental_prompt, output_key="fundamental_analysis"
+            llm=factual_llm,
+            prompt=fundamental_prompt,
+            output_key="fundamental_analysis",
         ),
         "technical": LLMChain(
             llm=llm, prompt=technical_prompt, output_key="technical_analysis"
@@ -255,73 +489,198 @@ def create_professional_chains():
 # ------------------------
 
 
-def professional_analysis(ticker: str):
-    """Run institutional-grade analysis workflow"""
-    print(f"\n🏦 Initiating Professional Analysis for {ticker}...")
+# Keeps background prefetch tasks referenced until they finish
+_prefetch_tasks = set()
+
+
+def next_watchlist_ticker(watchlist: List[str], analyzed: set) -> Optional[str]:
+    """Returns the first watchlist ticker not analyzed yet this session"""
+    return next((ticker for ticker in watchlist if ticker not in analyzed), None)
+
+
+async def professional_analysis(
+    ticker: str,
+    data: Optional[Tuple[Dict, pd.DataFrame]] = None,
+    stream: bool = True,
+    prefetch_next: Optional[str] = None,
+):
+    """
+    Run institutional-grade analysis workflow.
+    `data` is an already fetched (info, history) pair; with stream=False the
+    report is buffered and printed in one piece (used by batch_analyze).
+    `prefetch_next` is a ticker whose market data is fetched into the cache
+    in the background while the LLM chains run.
+    """
+    buffer = None if stream else []
+
+    def emit(text: str = "", end: str = "\n"):
+        if buffer is None:
+            print(text, end=end, flush=True)
+        else:
+            buffer.append(text + end)
+
+    def emit_token(token: str):
+        emit(token, end="")
+
+    emit(f"\n🏦 Initiating Professional Analysis for {ticker}...")
     start_time = time.time()
 
     try:
         # Step 1: Data Collection
-        print("\n📊 Collecting comprehensive data...")
-        info_dict, hist_data = get_comprehensive_stock_data(ticker)
+        emit("\n📊 Collecting comprehensive data...")
+        if data is None:
+            info_dict, hist_data = get_comprehensive_stock_data(ticker)
+        else:
+            info_dict, hist_data = {"info": data[0]}, data[1]
 
         # Step 2: Technical Analysis
-        print("📈 Calculating technical indicators...")
+        emit("📈 Calculating technical indicators...")
         technical_indicators = calculate_technical_indicators(hist_data)
 
         # Step 3: Fundamental Analysis
-        print("💼 Analyzing fundamentals...")
+        emit("💼 Analyzing fundamentals...")
         valuation_metrics = generate_valuation_metrics(info_dict["info"])
 
+        # Check for a unanimous rule-based call up front, so bad data fails
+        # before any LLM tokens are paid for
+        signal = rule_based_signal(valuation_metrics, technical_indicators)
+        rule_recommendation = (
+            rule_based_recommendation(
+                ticker, signal, valuation_metrics, technical_indicators
+            )
+            if signal is not None
+            else None
+        )
+
         # Step 4: Run Analysis Chains
         chains = create_professional_chains()
 
-        print("\n🔍 Conducting fundamental analysis...")
-        fundamental_result = chains["fundamental"].run(
-            {
-                "ticker": ticker,
-                "info": str(info_dict["info"]),
-                "valuation_metrics": str(valuation_metrics),
-            }
-        )
+        # The network is idle while waiting on Groq; warm the next ticker
+        if prefetch_next is not None:
+            task = asyncio.create_task(
+                asyncio.to_thread(market_data.prefetch, prefetch_next)
+            )
+            _prefetch_tasks.add(task)
+            task.add_done_callback(_prefetch_tasks.discard)
+
+        # Display Results, streaming the fundamental report and recommendation
+        emit("\n" + "=" * 80)
+        emit(f"🏛️  INSTITUTIONAL RESEARCH REPORT: {ticker}")
+        emit("=" * 80)
+        emit("\n⭐ FUNDAMENTAL ANALYSIS:")
+
+        # Fundamental and technical chains are independent, so run them
+        # concurrently; only one of them can stream to the console. The task
+        # group cancels the sibling if one fails, so no orphaned stream
+        # survives into the next run on the session's event loop.
+        try:
+            async with asyncio.TaskGroup() as group:
+                fundamental_task = group.create_task(
+                    cache.cached_arun(
+                        chains["fundamental"],
+                        {
+                            "ticker": ticker,
+                            "info": summarize_company_info(info_dict["info"]),
+                            "valuation_metrics": str(valuation_metrics),
+                        },
+                        on_token=emit_token,
+                    )
+                )
+                technical_task = group.create_task(
+                    cache.cached_arun(
+                        chains["technical"],
+                        {
+                            "ticker": ticker,
+                            "technical_indicators": str(technical_indicators),
+                            "price_data": summarize_price_data(hist_data),
+                        },
+                    )
+                )
+        except ExceptionGroup as errors:
+            raise errors.exceptions[0]
+        fundamental_result = fundamental_task.result()
+        technical_result = technical_task.result()
+
+        emit("\n\n📈 TECHNICAL ANALYSIS:")
+        emit(technical_result)
+
+        # Step 5: Generate Recommendation (skip the LLM for unanimous signals)
+        emit("\n💎 INVESTMENT RECOMMENDATION:")
+        if rule_recommendation is not None:
+            emit(rule_recommendation, end="")
+        else:
+            await cache.cached_arun(
+                chains["recommendation"],
+                {
+                    "ticker": ticker,
+                    "fundamental_analysis": fundamental_result,
+                    "technical_analysis": technical_result,
+                },
+                on_token=emit_token,
+            )
+        emit("\n\n" + "=" * 80)
+        emit(f"⏱️  Analysis completed in {time.time()-start_time:.2f} seconds")
+        # The counters are process-wide; batch_analyze reports them once
+        if stream:
+            emit(
+                f"🗄️  LLM cache: {cache.llm_stats['hits']} hits, "
+                f"{cache.llm_stats['misses']} misses"
+            )
 
-        print("\n📊 Performing technical analysis...")
-        technical_result = chains["technical"].run(
-            {
-                "ticker": ticker,
-                "technical_indicators": str(technical_indicators),
-                "price_data": str(hist_data.describe()),
-            }
-        )
+    except Exception as e:
+        emit(f"\n❌ Professional analysis failed: {str(e)}")
 
-        # Step 5: Generate Recommendation
-        print("\n💡 Formulating recommendation...")
-        recommendation = chains["recommendation"].run(
-            {
-                "ticker": ticker,
-                "fundamental_analysis": fundamental_result,
-                "technical_analysis": technical_result,
-            }
-        )
+    finally:
+        if buffer:
+            print("".join(buffer))
 
-        # Display Results
-        print("\n" + "=" * 80)
-        print(f"🏛️  INSTITUTIONAL RESEARCH REPORT: {ticker}")
-        print("=" * 80)
-        print("\n⭐ FUNDAMENTAL ANALYSIS:")
-        print(fundamental_result)
-        print("\n📈 TECHNICAL ANALYSIS:")
-        print(technical_result)
-        print("\n💎 INVESTMENT RECOMMENDATION:")
-        print(recommendation)
-        print("\n" + "=" * 80)
-        print(f"⏱️  Analysis completed in {time.time()-start_time:.2f} seconds")
 
+async def batch_analyze(tickers: List[str]):
+    """Run institutional-grade analysis for several tickers concurrently"""
+    print(f"\n📦 Fetching market data for {', '.join(tickers)}...")
+    try:
+        batch, failures = await asyncio.to_thread(market_data.fetch_batch, tickers)
     except Exception as e:
-        print(f"\n❌ Professional analysis failed: {str(e)}")
+        print(f"\n❌ Batch data collection failed: {str(e)}")
+        return
+
+    for ticker, reason in failures.items():
+        print(f"\n❌ Skipping {ticker}: {reason}")
+
+    await asyncio.gather(
+        *(
+            professional_analysis(ticker, data=data, stream=False)
+            for ticker, data in batch.items()
+        )
+    )
+
+    print(
+        f"\n🗄️  LLM cache: {cache.llm_stats['hits']} hits, "
+        f"{cache.llm_stats['misses']} misses"
+    )
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Institutional stock analysis")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="always refetch market data and LLM output",
+    )
+    parser.add_argument(
+        "--watchlist",
+        metavar="FILE",
+        help="file of tickers to prefetch while an analysis runs",
+    )
+    args = parser.parse_args()
+    cache.set_enabled(not args.no_cache)
+
+    watchlist = []
+    if args.watchlist:
+        with open(args.watchlist) as f:
+            watchlist = [t.upper() for t in f.read().replace(",", " ").split()]
+    analyzed = set()
+
     print(
         """
     #############################################
@@ -333,25 +692,40 @@ def main():
     """
     )
 
-    while True:
-        try:
-            ticker = input("\nEnter stock ticker (or 'exit' to quit): ").strip().upper()
-
-            if ticker.lower() in ["exit", "quit"]:
-                print("\nTerminating analysis session...")
+    with session_runner() as runner:
+        while True:
+            try:
+                entry = (
+                    input("\nEnter ticker(s), comma separated (or 'exit' to quit): ")
+                    .strip()
+                    .upper()
+                )
+                tickers = [t.strip() for t in entry.split(",") if t.strip()]
+
+                if entry.lower() in ["exit", "quit"]:
+                    print("\nTerminating analysis session...")
+                    break
+
+                if not tickers:
+                    print("Please enter a valid ticker symbol")
+                    continue
+
+                analyzed.update(tickers)
+                if len(tickers) > 1:
+                    runner.run(batch_analyze(tickers))
+                else:
+                    runner.run(
+                        professional_analysis(
+                            tickers[0],
+                            prefetch_next=next_watchlist_ticker(watchlist, analyzed),
+                        )
+                    )
+
+            except KeyboardInterrupt:
+                print("\nSession terminated by user")
                 break
-
-            if not ticker:
-                print("Please enter a valid ticker symbol")
-                continue
-
-            professional_analysis(ticker)
-
-        except KeyboardInterrupt:
-            print("\nSession terminated by user")
-            break
-        except Exception as e:
-            print(f"\n⚠️  Error: {str(e)}")
+            except Exception as e:
+                print(f"\n⚠️  Error: {str(e)}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,198 @@
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+import yfinance as yf
+from curl_cffi import requests as curl_requests
+
+import cache
+
+# Ticker fundamentals change at most daily
+DATA_TTL = 6 * 60 * 60
+
+# Price history is stored as one Parquet file per ticker/period/day
+HISTORY_DIR = os.path.join(cache.CACHE_DIR, "history")
+
+# Symbols safe to use in a filename; anything else skips the history cache
+_SAFE_TICKER = re.compile(r"[A-Z0-9.^=-]+")
+
+# One keep-alive session shared by every Yahoo request. yfinance requires
+# curl_cffi sessions; browser impersonation also sets the compression headers.
+session = curl_requests.Session(impersonate="chrome")
+
+# curl_cffi keeps one connection cache per thread, so concurrent fetches go
+# through this long-lived pool: its threads (and their warm connections)
+# are reused by every analysis instead of starting cold each call.
+executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="yahoo")
+
+# ------------------------
+# Cached Yahoo Finance Fetchers
+# ------------------------
+
+
+def _cache_key(kind: str, ticker: str) -> str:
+    return f"{kind}:{ticker}:{date.today().isoformat()}"
+
+
+def fetch_info(ticker: str) -> Dict:
+    """Returns yfinance `info` for ticker, served from cache when fresh"""
+    key = _cache_key("info", ticker)
+    info = cache.lookup(key)
+    if info is not None:
+        return info
+
+    info = yf.Ticker(ticker, session=session).info
+
+    # Unknown tickers come back without a name; don't cache those
+    if info.get("longName"):
+        cache.store(key, info, DATA_TTL)
+    return info
+
+
+def _history_path(ticker: str, period: str) -> Optional[str]:
+    if not _SAFE_TICKER.fullmatch(ticker):
+        return None
+    filename = f"{ticker}_{period}_{date.today().isoformat()}.parquet"
+    return os.path.join(HISTORY_DIR, filename)
+
+
+def _cached_history(ticker: str, period: str):
+    path = _history_path(ticker, period)
+    if not cache.is_enabled() or path is None:
+        return None
+
+    try:
+        if time.time() - os.path.getmtime(path) > DATA_TTL:
+            return None
+    except OSError:
+        return None
+
+    try:
+        return pd.read_parquet(path)
+    except Exception:
+        # Unreadable file: drop it so the refetch can write a fresh one
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+
+
+def _prune_history():
+    """Deletes history files from earlier days"""
+    current = f"_{date.today().isoformat()}.parquet"
+    for filename in os.listdir(HISTORY_DIR):
+        if filename.endswith(".parquet") and not filename.endswith(current):
+            try:
+                os.remove(os.path.join(HISTORY_DIR, filename))
+            except OSError:
+                pass
+
+
+def _store_history(ticker: str, period: str, history: pd.DataFrame):
+    path = _history_path(ticker, period)
+    if not cache.is_enabled() or path is None or history.empty:
+        return
+
+    # Write then rename, so a concurrent prefetch never sees a partial file.
+    # A failed cache write must not fail the fetch that produced the data.
+    tmp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(HISTORY_DIR, exist_ok=True)
+        history.to_parquet(tmp_path, compression="snappy")
+        os.replace(tmp_path, path)
+        _prune_history()
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def fetch_history(ticker: str, period: str = "1y") -> pd.DataFrame:
+    """Returns price history for ticker, served from cache when fresh"""
+    history = _cached_history(ticker, period)
+    if history is not None:
+        return history
+
+    history = yf.Ticker(ticker, session=session).history(period=period)
+    _store_history(ticker, period, history)
+    return history
+
+
+def _fetch_info_safe(ticker: str):
+    try:
+        return fetch_info(ticker), None
+    except Exception as e:
+        return None, str(e)
+
+
+def fetch_batch(
+    tickers: List[str], period: str = "1y"
+) -> Tuple[Dict[str, Tuple[Dict, pd.DataFrame]], Dict[str, str]]:
+    """
+    Fetches info and price history for several tickers at once:
+    - History for every uncached ticker comes from a single yf.download call
+    - Info requests run concurrently
+    One bad symbol doesn't fail the batch; it is reported instead.
+    Returns ({ticker: (info, history)}, {ticker: failure reason})
+    """
+    histories = {ticker: _cached_history(ticker, period) for ticker in tickers}
+    missing = [ticker for ticker, history in histories.items() if history is None]
+    failures = {}
+
+    if missing:
+        downloaded = yf.download(
+            " ".join(missing),
+            period=period,
+            group_by="ticker",
+            auto_adjust=True,
+            threads=True,
+            progress=False,
+            session=session,
+        )
+        for ticker in missing:
+            try:
+                # Older yfinance returns flat columns when only one symbol is asked for
+                if isinstance(downloaded.columns, pd.MultiIndex):
+                    history = downloaded[ticker].dropna(subset=["Close"])
+                else:
+                    history = downloaded.dropna(subset=["Close"])
+            except KeyError:
+                history = pd.DataFrame()
+
+            if history.empty:
+                failures[ticker] = "no price history"
+                continue
+            _store_history(ticker, period, history)
+            histories[ticker] = history
+
+    remaining = [ticker for ticker in tickers if ticker not in failures]
+    infos = dict(zip(remaining, executor.map(_fetch_info_safe, remaining)))
+
+    results = {}
+    for ticker in remaining:
+        info, error = infos[ticker]
+        if error is not None:
+            failures[ticker] = error
+        else:
+            results[ticker] = (info, histories[ticker])
+
+    return results, failures
+
+
+def prefetch(ticker: str):
+    """Warms the cache for ticker; errors are ignored (the real fetch retries)"""
+    if not cache.is_enabled():
+        return
+
+    try:
+        fetch_info(ticker)
+        fetch_history(ticker)
+    except Exception:
+        pass